@@ -26,6 +26,38 @@ from acloud.internal.lib import utils
 
 
 CMD_CREATE = "create"
+# TODO(b/118439885): Old arg formats to support transition, delete when
+# transistion is done.
+# Tuples of (option string, default value).
+_DEPRECATED_ARGS = (
+    ("--serial_log_file", None),
+    ("--build_id", None),
+    ("--build_target", None),
+    ("--system_branch", None),
+    ("--system_build_id", None),
+    ("--system_build_target", None),
+    ("--kernel_build_id", None),
+    ("--kernel_branch", None),
+    ("--kernel_build_target", "kernel"))
+_PATH_NOT_EXIST_MSG = "Specified path doesn't exist: %s"
+
+
+def _ExistingPath(path):
+    """Argparse type that checks the specified path exists.
+
+    Args:
+        path: String of the path passed in by the user.
+
+    Returns:
+        The path unchanged. An empty path means "not specified" and is
+        passed through without checking.
+
+    Raises:
+        argparse.ArgumentTypeError: The path doesn't exist.
+    """
+    if path and not os.path.exists(path):
+        raise argparse.ArgumentTypeError(_PATH_NOT_EXIST_MSG % path)
+    return path
 
 
 # TODO: Add this into main create args once create_cf/gf is deprecated.
@@ -56,8 +88,8 @@ def AddCommonCreateArgs(parser):
         const=constants.INS_KEY_VNC,
         dest="autoconnect",
         required=False,
-        choices=[constants.INS_KEY_VNC, constants.INS_KEY_ADB,
-                 constants.INS_KEY_WEBRTC],
+        choices=(constants.INS_KEY_VNC, constants.INS_KEY_ADB,
+                 constants.INS_KEY_WEBRTC),
         help="Determines to establish a tunnel forwarding adb/vnc and "
              "launch VNC/webrtc. Establish a tunnel forwarding adb and vnc "
              "then launch vnc if --autoconnect vnc is provided. Establish a "
@@ -210,62 +242,12 @@ def AddCommonCreateArgs(parser):
         default=None,
         help="GPU accelerator to use if any. e.g. nvidia-tesla-k80.")
 
-    # TODO(b/118439885): Old arg formats to support transition, delete when
-    # transistion is done.
-    parser.add_argument(
-        "--serial_log_file",
-        type=str,
-        dest="serial_log_file",
-        required=False,
-        help=argparse.SUPPRESS)
-    parser.add_argument(
-        "--build_id",
-        type=str,
-        dest="build_id",
-        required=False,
-        help=argparse.SUPPRESS)
-    parser.add_argument(
-        "--build_target",
-        type=str,
-        dest="build_target",
-        required=False,
-        help=argparse.SUPPRESS)
-    parser.add_argument(
-        "--system_branch",
-        type=str,
-        dest="system_branch",
-        required=False,
-        help=argparse.SUPPRESS)
-    parser.add_argument(
-        "--system_build_id",
-        type=str,
-        dest="system_build_id",
-        required=False,
-        help=argparse.SUPPRESS)
-    parser.add_argument(
-        "--system_build_target",
-        type=str,
-        dest="system_build_target",
-        required=False,
-        help=argparse.SUPPRESS)
-    parser.add_argument(
-        "--kernel_build_id",
-        type=str,
-        dest="kernel_build_id",
-        required=False,
-        help=argparse.SUPPRESS)
-    parser.add_argument(
-        "--kernel_branch",
-        type=str,
-        dest="kernel_branch",
-        required=False,
-        help=argparse.SUPPRESS)
-    parser.add_argument(
-        "--kernel_build_target",
-        type=str,
-        dest="kernel_build_target",
-        default="kernel",
-        help=argparse.SUPPRESS)
+    for option, default in _DEPRECATED_ARGS:
+        parser.add_argument(
+            option,
+            type=str,
+            default=default,
+            help=argparse.SUPPRESS)
 
 
 def GetCreateArgParser(subparser):
@@ -303,7 +285,7 @@ def GetCreateArgParser(subparser):
         type=str,
         dest="avd_type",
         default=constants.TYPE_CF,
-        choices=[constants.TYPE_GCE, constants.TYPE_CF, constants.TYPE_GF, constants.TYPE_CHEEPS],
+        choices=(constants.TYPE_GCE, constants.TYPE_CF, constants.TYPE_GF, constants.TYPE_CHEEPS),
         help="Android Virtual Device type (default %s)." % constants.TYPE_CF)
     create_parser.add_argument(
         "--flavor",
@@ -312,7 +294,7 @@ def GetCreateArgParser(subparser):
         help="The device flavor of the AVD (default %s)." % constants.FLAVOR_PHONE)
     create_parser.add_argument(
         "--local-image",
-        type=str,
+        type=_ExistingPath,
         dest="local_image",
         nargs="?",
         default="",
@@ -323,7 +305,7 @@ def GetCreateArgParser(subparser):
         "/path/to/file")
     create_parser.add_argument(
         "--local-system-image",
-        type=str,
+        type=_ExistingPath,
         dest="local_system_image",
         nargs="?",
         default="",
@@ -333,7 +315,7 @@ def GetCreateArgParser(subparser):
         "e.g., --local-system-image or --local-system-image /path/to/dir")
     create_parser.add_argument(
         "--local-tool",
-        type=str,
+        type=_ExistingPath,
         dest="local_tool",
         action="append",
         default=[],
@@ -455,40 +437,28 @@ def GetCreateArgParser(subparser):
 def _VerifyLocalArgs(args):
     """Verify args starting with --local.
 
+    The paths of --local-image, --local-system-image and --local-tool are
+    checked by _ExistingPath while parsing.
+
     Args:
         args: Namespace object from argparse.parse_args.
 
     Raises:
-        errors.CheckPathError: Image path doesn't exist.
         errors.UnsupportedCreateArgs: The specified avd type does not support
                                       --local-system-image.
         errors.UnsupportedLocalInstanceId: Local instance ID is invalid.
     """
-    if args.local_image and not os.path.exists(args.local_image):
-        raise errors.CheckPathError(
-            "Specified path doesn't exist: %s" % args.local_image)
-
     # TODO(b/133211308): Support TYPE_CF.
     if args.local_system_image != "" and args.avd_type != constants.TYPE_GF:
         raise errors.UnsupportedCreateArgs("%s instance does not support "
                                            "--local-system-image" %
                                            args.avd_type)
 
-    if (args.local_system_image and
-            not os.path.exists(args.local_system_image)):
-        raise errors.CheckPathError(
-            "Specified path doesn't exist: %s" % args.local_system_image)
-
     if args.local_instance is not None and args.local_instance < 1:
         raise errors.UnsupportedLocalInstanceId("Local instance id can not be "
                                                 "less than 1. Actually passed:%d"
                                                 % args.local_instance)
 
-    for tool_dir in args.local_tool:
-        if not os.path.exists(tool_dir):
-            raise errors.CheckPathError(
-                "Specified path doesn't exist: %s" % tool_dir)
-
     if args.autoconnect == constants.INS_KEY_WEBRTC:
         if args.avd_type != constants.TYPE_CF:
             raise errors.UnsupportedCreateArgs(
@@ -552,6 +522,10 @@ def VerifyArgs(args):
         raise errors.UnsupportedMultiAdbPort(
             "--adb-port is not supported for multi-devices.")
 
+    # Local instances can't be created in parallel, image files can't be
+    # shared among instances (see IsLocalImageOccupied), so each local
+    # instance needs its own image dir and must be created with its own
+    # --local-instance id.
     if args.num > 1 and args.local_instance is not None:
         raise errors.UnsupportedCreateArgs(
             "--num is not supported for local instance.")
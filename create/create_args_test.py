@@ -13,6 +13,7 @@
 # limitations under the License.
 """Tests for create."""
 
+import argparse
 import unittest
 import mock
 
@@ -74,6 +75,37 @@ class CreateArgsTest(driver_test_lib.BaseDriverTest):
         self.assertRaises(errors.UnsupportedCreateArgs,
                           create_args.VerifyArgs, mock_args)
 
+    def testDeprecatedArgs(self):
+        """test the old arg formats are parsed into the same dest."""
+        parser = argparse.ArgumentParser()
+        create_args.GetCreateArgParser(parser.add_subparsers())
+        args = parser.parse_args(["create", "--build_id", "1234",
+                                  "--kernel_branch", "fake_branch"])
+        self.assertEqual("1234", args.build_id)
+        self.assertEqual("fake_branch", args.kernel_branch)
+        self.assertEqual("kernel", args.kernel_build_target)
+        self.assertEqual(None, args.system_build_id)
+
+    @mock.patch("os.path.exists")
+    def testLocalPathArgs(self, mock_exists):
+        """test the local path args are checked while parsing."""
+        parser = argparse.ArgumentParser()
+        create_args.GetCreateArgParser(parser.add_subparsers())
+        mock_exists.return_value = True
+        args = parser.parse_args(["create", "--local-image", "/image/path",
+                                  "--local-tool", "/tool/path"])
+        self.assertEqual("/image/path", args.local_image)
+        self.assertEqual(["/tool/path"], args.local_tool)
+        # The default empty path shouldn't be checked.
+        mock_exists.assert_has_calls([mock.call("/image/path"),
+                                      mock.call("/tool/path")])
+        self.assertEqual(2, mock_exists.call_count)
+
+        mock_exists.return_value = False
+        with mock.patch("sys.stderr"):
+            self.assertRaises(SystemExit, parser.parse_args,
+                              ["create", "--local-image", "/image/path"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -53,17 +53,22 @@ from acloud.public import report
 
 logger = logging.getLogger(__name__)
 
-_CMD_LAUNCH_CVD_ARGS = (" -daemon -cpus %s -x_res %s -y_res %s -dpi %s "
-                        "-memory_mb %s -run_adb_connector=%s "
-                        "-system_image_dir %s -instance_dir %s")
-_CMD_LAUNCH_CVD_DISK_ARGS = (" -blank_data_image_mb %s "
-                             "-data_policy always_create")
+_CMD_LAUNCH_CVD_ARGS = ("-daemon", "-cpus", "%(cpu)s", "-x_res", "%(x_res)s",
+                        "-y_res", "%(y_res)s", "-dpi", "%(dpi)s",
+                        "-memory_mb", "%(memory)s",
+                        "-run_adb_connector=%(run_adb_connector)s",
+                        "-system_image_dir", "%(system_image_dir)s",
+                        "-instance_dir", "%(instance_dir)s")
+_CMD_LAUNCH_CVD_DISK_ARGS = ("-blank_data_image_mb", "%(disk)s",
+                             "-data_policy", "always_create")
 _CONFIRM_RELAUNCH = ("\nCuttlefish AVD[id:%d] is already running. \n"
                      "Enter 'y' to terminate current instance and launch a new "
                      "instance, enter anything else to exit out[y/N]: ")
 _LAUNCH_CVD_TIMEOUT_SECS = 120  # default timeout as 120 seconds
 _LAUNCH_CVD_TIMEOUT_ERROR = ("Cuttlefish AVD launch timeout, did not complete "
                              "within %d secs.")
+_HOST_OUT_NOT_SET_MSG = (" $%s is not set either, did you forget to run "
+                         "`lunch`?")
 _VIRTUAL_DISK_PATHS = "virtual_disk_paths"
 
 
@@ -138,20 +143,23 @@ class LocalImageLocalInstance(base_avd_create.BaseAVDCreate):
     @staticmethod
     def _FindCvdHostBinaries(search_paths):
         """Return the directory that contains CVD host binaries."""
-        for search_path in search_paths:
+        dirs_to_check = list(search_paths)
+        host_out_dir = os.environ.get(constants.ENV_ANDROID_HOST_OUT)
+        # Don't stat launch_cvd again if --local-tool is $ANDROID_HOST_OUT.
+        if host_out_dir and host_out_dir not in dirs_to_check:
+            dirs_to_check.append(host_out_dir)
+
+        for search_path in dirs_to_check:
             if os.path.isfile(os.path.join(search_path, "bin",
                                            constants.CMD_LAUNCH_CVD)):
                 return search_path
 
-        host_out_dir = os.environ.get(constants.ENV_ANDROID_HOST_OUT)
-        if (host_out_dir and
-                os.path.isfile(os.path.join(host_out_dir, "bin",
-                                            constants.CMD_LAUNCH_CVD))):
-            return host_out_dir
-
-        raise errors.GetCvdLocalHostPackageError(
-            "CVD host binaries are not found. Please run `make hosttar`, or "
-            "set --local-tool to an extracted CVD host package.")
+        err_msg = ("CVD host binaries are not found. Please run `make "
+                   "hosttar`, or set --local-tool to an extracted CVD host "
+                   "package.")
+        if not host_out_dir:
+            err_msg += _HOST_OUT_NOT_SET_MSG % constants.ENV_ANDROID_HOST_OUT
+        raise errors.GetCvdLocalHostPackageError(err_msg)
 
     def GetImageArtifactsPath(self, avd_spec):
         """Get image artifacts path.
@@ -186,20 +194,21 @@ class LocalImageLocalInstance(base_avd_create.BaseAVDCreate):
             local_instance_id: Integer of instance id.
 
         Returns:
-            String, launch_cvd cmd.
+            List of strings, launch_cvd cmd args.
         """
-        instance_dir = instance.GetLocalInstanceRuntimeDir(local_instance_id)
-        launch_cvd_w_args = launch_cvd_path + _CMD_LAUNCH_CVD_ARGS % (
-            hw_property["cpu"], hw_property["x_res"], hw_property["y_res"],
-            hw_property["dpi"], hw_property["memory"],
-            ("true" if connect_adb else "false"), system_image_dir,
-            instance_dir)
+        launch_cvd_args = dict(
+            hw_property,
+            run_adb_connector="true" if connect_adb else "false",
+            system_image_dir=system_image_dir,
+            instance_dir=instance.GetLocalInstanceRuntimeDir(local_instance_id))
+        arg_templates = _CMD_LAUNCH_CVD_ARGS
         if constants.HW_ALIAS_DISK in hw_property:
-            launch_cvd_w_args = (launch_cvd_w_args + _CMD_LAUNCH_CVD_DISK_ARGS %
-                                 hw_property[constants.HW_ALIAS_DISK])
+            arg_templates += _CMD_LAUNCH_CVD_DISK_ARGS
+        launch_cvd_w_args = [launch_cvd_path] + [
+            arg % launch_cvd_args for arg in arg_templates]
 
-        launch_cmd = utils.AddUserGroupsToCmd(launch_cvd_w_args,
-                                              constants.LIST_CF_USER_GROUPS)
+        launch_cmd = utils.AddUserGroupsToCmdArgs(launch_cvd_w_args,
+                                                  constants.LIST_CF_USER_GROUPS)
         logger.debug("launch_cvd cmd:\n %s", launch_cmd)
         return launch_cmd
 
@@ -213,7 +222,7 @@ class LocalImageLocalInstance(base_avd_create.BaseAVDCreate):
         3. Launch local AVD.
 
         Args:
-            cmd: String, launch_cvd command.
+            cmd: List of strings, launch_cvd command args.
             host_bins_path: String of host package directory.
             local_instance_id: Integer of instance id.
             local_image_path: String of local image directory.
@@ -244,22 +253,24 @@ class LocalImageLocalInstance(base_avd_create.BaseAVDCreate):
                     utils.TextColors.FAIL)
                 sys.exit(constants.EXIT_BY_USER)
 
-        self._LaunchCvd(cmd, local_instance_id, timeout=timeout_secs)
+        with utils.TimeExecute(
+                function_description="Waiting for AVD(s) to boot up"):
+            self._LaunchCvd(cmd, local_instance_id, timeout=timeout_secs)
 
     @staticmethod
-    @utils.TimeExecute(function_description="Waiting for AVD(s) to boot up")
     def _LaunchCvd(cmd, local_instance_id, timeout=None):
         """Execute Launch CVD.
 
         Kick off the launch_cvd command and log the output.
 
         Args:
-            cmd: String, launch_cvd command.
+            cmd: List of strings, launch_cvd command args.
             local_instance_id: Integer of instance id.
             timeout: Integer, the number of seconds to wait for the AVD to boot up.
 
         Raises:
-            errors.LaunchCVDFail when any CalledProcessError.
+            errors.LaunchCVDFail when any CalledProcessError or launch_cvd
+            doesn't complete within timeout.
         """
         # Delete the cvd home/runtime temp if exist. The runtime folder is
         # under the cvd home dir, so we only delete them from home dir.
@@ -273,16 +284,22 @@ class LocalImageLocalInstance(base_avd_create.BaseAVDCreate):
         cvd_env[constants.ENV_CUTTLEFISH_INSTANCE] = str(local_instance_id)
         # Check the result of launch_cvd command.
         # An exit code of 0 is equivalent to VIRTUAL_DEVICE_BOOT_COMPLETED
-        process = subprocess.Popen(cmd, shell=True, stderr=subprocess.STDOUT,
-                                   env=cvd_env)
+        process = subprocess.Popen(cmd, stderr=subprocess.STDOUT, env=cvd_env)
+        timed_out = threading.Event()
         if timeout:
-            timer = threading.Timer(timeout, process.kill)
+            def _KillOnTimeout():
+                if process.poll() is None:
+                    timed_out.set()
+                    process.kill()
+            timer = threading.Timer(timeout, _KillOnTimeout)
             timer.start()
         process.wait()
         if timeout:
             timer.cancel()
         if process.returncode == 0:
             return
+        if timed_out.is_set():
+            raise errors.LaunchCVDFail(_LAUNCH_CVD_TIMEOUT_ERROR % timeout)
         raise errors.LaunchCVDFail(
             "Can't launch cuttlefish AVD. Return code:%s. \nFor more detail: "
             "%s/launcher.log" % (str(process.returncode), cvd_runtime_dir))
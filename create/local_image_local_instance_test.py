@@ -18,6 +18,7 @@
 import os
 import shutil
 import subprocess
+import threading
 import unittest
 import mock
 
@@ -33,15 +34,30 @@ from acloud.internal.lib import utils
 class LocalImageLocalInstanceTest(driver_test_lib.BaseDriverTest):
     """Test LocalImageLocalInstance method."""
 
-    LAUNCH_CVD_CMD_WITH_DISK = """sg group1 <<EOF
-sg group2
-launch_cvd -daemon -cpus fake -x_res fake -y_res fake -dpi fake -memory_mb fake -run_adb_connector=true -system_image_dir fake_image_dir -instance_dir fake_cvd_dir -blank_data_image_mb fake -data_policy always_create
-EOF"""
+    LAUNCH_CVD_CMD_WITH_DISK = [
+        "/bin/sh", "-c",
+        "sg group1 <<EOF\n"
+        "sg group2\n"
+        "launch_cvd -daemon -cpus fake -x_res fake -y_res fake -dpi fake "
+        "-memory_mb fake -run_adb_connector=true -system_image_dir "
+        "fake_image_dir -instance_dir fake_cvd_dir -blank_data_image_mb fake "
+        "-data_policy always_create\n"
+        "EOF"]
 
-    LAUNCH_CVD_CMD_NO_DISK = """sg group1 <<EOF
-sg group2
-launch_cvd -daemon -cpus fake -x_res fake -y_res fake -dpi fake -memory_mb fake -run_adb_connector=true -system_image_dir fake_image_dir -instance_dir fake_cvd_dir
-EOF"""
+    LAUNCH_CVD_CMD_NO_DISK = [
+        "/bin/sh", "-c",
+        "sg group1 <<EOF\n"
+        "sg group2\n"
+        "launch_cvd -daemon -cpus fake -x_res fake -y_res fake -dpi fake "
+        "-memory_mb fake -run_adb_connector=true -system_image_dir "
+        "fake_image_dir -instance_dir fake_cvd_dir\n"
+        "EOF"]
+
+    LAUNCH_CVD_CMD_IN_GROUPS = [
+        "launch_cvd", "-daemon", "-cpus", "fake", "-x_res", "fake",
+        "-y_res", "fake", "-dpi", "fake", "-memory_mb", "fake",
+        "-run_adb_connector=true", "-system_image_dir", "fake_image_dir",
+        "-instance_dir", "fake_cvd_dir"]
 
     _EXPECTED_DEVICES_IN_REPORT = [
         {
@@ -118,6 +134,8 @@ EOF"""
             with self.assertRaises(errors.GetCvdLocalHostPackageError):
                 self.local_image_local_instance._FindCvdHostBinaries(
                     [cvd_host_dir])
+            # ANDROID_HOST_OUT is the same as the search path.
+            mock_isfile.assert_called_once_with("/unit/test/bin/launch_cvd")
 
         mock_isfile.side_effect = (
             lambda path: path == "/unit/test/bin/launch_cvd")
@@ -133,6 +151,13 @@ EOF"""
                 [cvd_host_dir])
             self.assertEqual(path, cvd_host_dir)
 
+            # The error should point out that ANDROID_HOST_OUT isn't set.
+            mock_isfile.side_effect = None
+            with self.assertRaisesRegexp(errors.GetCvdLocalHostPackageError,
+                                         "ANDROID_HOST_OUT is not set"):
+                self.local_image_local_instance._FindCvdHostBinaries(
+                    [cvd_host_dir])
+
     # pylint: disable=protected-access
     @mock.patch.object(instance, "GetLocalInstanceRuntimeDir")
     @mock.patch.object(utils, "CheckUserInGroups")
@@ -157,6 +182,13 @@ EOF"""
             "fake_cvd_dir")
         self.assertEqual(launch_cmd, self.LAUNCH_CVD_CMD_NO_DISK)
 
+        # User is in the groups, no need to run launch_cvd by a shell.
+        mock_usergroups.return_value = True
+        launch_cmd = self.local_image_local_instance.PrepareLaunchCVDCmd(
+            constants.CMD_LAUNCH_CVD, hw_property, True, "fake_image_dir",
+            "fake_cvd_dir")
+        self.assertEqual(launch_cmd, self.LAUNCH_CVD_CMD_IN_GROUPS)
+
     @mock.patch.object(local_image_local_instance.LocalImageLocalInstance,
                        "_LaunchCvd")
     @mock.patch.object(utils, "GetUserAnswerYes")
@@ -205,7 +237,7 @@ EOF"""
     def testLaunchCVD(self):
         """test _LaunchCvd should call subprocess.Popen with the specific env"""
         local_instance_id = 3
-        launch_cvd_cmd = "launch_cvd"
+        launch_cvd_cmd = ["launch_cvd"]
         cvd_env = {}
         cvd_env[constants.ENV_CVD_HOME] = "fake_home"
         cvd_env[constants.ENV_CUTTLEFISH_INSTANCE] = str(
@@ -223,10 +255,39 @@ EOF"""
                                                    local_instance_id)
         # pylint: disable=no-member
         subprocess.Popen.assert_called_once_with(launch_cvd_cmd,
-                                                 shell=True,
                                                  stderr=subprocess.STDOUT,
                                                  env=cvd_env)
 
+    # pylint: disable=protected-access
+    @mock.patch.dict("os.environ", clear=True)
+    def testLaunchCVDTimeout(self):
+        """test _LaunchCvd kills launch_cvd if it doesn't complete in time."""
+        process = mock.MagicMock(returncode=-9)
+        process.poll.return_value = None
+        self.Patch(subprocess, "Popen", return_value=process)
+        self.Patch(instance, "GetLocalInstanceHomeDir",
+                   return_value="fake_home")
+        self.Patch(os, "makedirs")
+        self.Patch(shutil, "rmtree")
+        # Fire the timer right away as if launch_cvd ran out of time.
+        mock_timer = self.Patch(threading, "Timer")
+        mock_timer.return_value.start.side_effect = (
+            lambda: mock_timer.call_args[0][1]())
+
+        with self.assertRaisesRegexp(errors.LaunchCVDFail, "timeout"):
+            self.local_image_local_instance._LaunchCvd(["launch_cvd"], 3,
+                                                       timeout=10)
+        process.kill.assert_called_once_with()
+        mock_timer.assert_called_once_with(10, mock.ANY)
+
+        # launch_cvd has exited with 0 when the timer fires.
+        process.reset_mock()
+        process.returncode = 0
+        process.poll.return_value = 0
+        self.local_image_local_instance._LaunchCvd(["launch_cvd"], 3,
+                                                   timeout=10)
+        process.kill.assert_not_called()
+
 
 if __name__ == "__main__":
     unittest.main()
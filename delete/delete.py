@@ -20,7 +20,6 @@ of an Android Virtual Device.
 from __future__ import print_function
 
 import logging
-import re
 import subprocess
 
 from acloud import errors
@@ -38,9 +37,6 @@ from acloud.public import report
 
 logger = logging.getLogger(__name__)
 
-_COMMAND_GET_PROCESS_ID = ["pgrep", "run_cvd"]
-_COMMAND_GET_PROCESS_COMMAND = ["ps", "-o", "command", "-p"]
-_RE_RUN_CVD = re.compile(r"^(?P<run_cvd>.+run_cvd)")
 _LOCAL_INSTANCE_PREFIX = "local-"
 
 
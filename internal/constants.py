@@ -112,9 +112,7 @@ GCE_VNC_PORT = 6444
 GF_ADB_PORT = 5555
 GF_VNC_PORT = 6444
 
-COMMAND_PS = ["ps", "aux"]
 CMD_LAUNCH_CVD = "launch_cvd"
-CMD_PGREP = "pgrep"
 CMD_STOP_CVD = "stop_cvd"
 CMD_RUN_CVD = "run_cvd"
 ENV_ANDROID_BUILD_TOP = "ANDROID_BUILD_TOP"
@@ -152,9 +152,10 @@ class AdbTools(object):
         for device in device_info.splitlines():
             match = re.match(_RE_ADB_DEVICE_INFO % self._device_serial, device)
             if match:
+                device_attributes = match.groupdict()
                 self._device_information = {
-                    attribute: match.group(attribute) if match.group(attribute)
-                               else None for attribute in _DEVICE_ATTRIBUTES}
+                    attribute: device_attributes[attribute] or None
+                    for attribute in _DEVICE_ATTRIBUTES}
 
     def IsAdbConnectionAlive(self):
         """Check devices connect alive.
@@ -21,10 +21,12 @@ import binascii
 import collections
 import errno
 import getpass
+import glob
 import grp
 import logging
 import os
 import platform
+import re
 import shlex
 import shutil
 import signal
@@ -40,6 +42,7 @@ import webbrowser
 import zipfile
 
 import six
+from six.moves import shlex_quote
 
 from acloud import errors
 from acloud.internal import constants
@@ -80,6 +83,7 @@ AVD_PORT_DICT = {
 _VNC_BIN = "ssvnc"
 _CMD_KILL = ["pkill", "-9", "-f"]
 _CMD_SG = "sg "
+_CMD_SHELL = ["/bin/sh", "-c"]
 _CMD_START_VNC = "%(bin)s vnc://127.0.0.1:%(port)d"
 _CMD_INSTALL_SSVNC = "sudo apt-get --assume-yes install ssvnc"
 _ENV_DISPLAY = "DISPLAY"
@@ -101,6 +105,14 @@ _EvaluatedResult = collections.namedtuple("EvaluatedResult",
 _SUPPORTED_SYSTEMS_AND_DISTS = {"Linux": ["Ubuntu", "Debian"]}
 _DEFAULT_TIMEOUT_ERR = "Function did not complete within %d secs."
 _SSVNC_VIEWER_PATTERN = "vnc://127.0.0.1:%(vnc_port)d"
+_PROC_CMDLINE_GLOB = "/proc/[0-9]*/cmdline"
+_CMD_PS_PID_ARGS = ["ps", "-eo", "pid=,args="]
+# How long a process snapshot is reused, one acloud command usually queries
+# the processes several times within this window.
+_PROCESS_SNAPSHOT_TTL_SECS = 2
+_process_snapshot_cache = {"bucket": None, "snapshot": None}
+# Store the pid and the argv list of a running process.
+ProcessInfo = collections.namedtuple("ProcessInfo", ["pid", "argv"])
 
 
 class TempDir(object):
@@ -682,7 +694,14 @@ def BootEvaluator(boot_dict):
 
 
 class TimeExecute(object):
-    """Count the function execute time."""
+    """Count the function execute time.
+
+    It can be used as a decorator of the function or as a context manager
+    around the statements to be timed, e.g.
+        with utils.TimeExecute(function_description="Waiting"):
+            WaitForSomething()
+    The with-block has no result, so it can't take a result_evaluator.
+    """
 
     def __init__(self, function_description=None, print_before_call=True,
                  print_status=True, result_evaluator=DefaultEvaluator,
@@ -708,6 +727,86 @@ class TimeExecute(object):
         self._print_status = print_status
         self._result_evaluator = result_evaluator
         self._display_waiting_dots = display_waiting_dots
+        self._timestart = None
+
+    def _Start(self):
+        """Start counting and print the description if needed.
+
+        Returns:
+            Float, the start time.
+        """
+        if self._print_before_call:
+            waiting_dots = "..." if self._display_waiting_dots else ""
+            PrintColorString("%s %s"% (self._function_description,
+                                       waiting_dots), end="")
+        return time.time()
+
+    def _PrintResult(self, timestart, result):
+        """Print the execute time and the status of the result.
+
+        Args:
+            timestart: Float, the start time.
+            result: The result to be evaluated by the result evaluator.
+        """
+        result_time = time.time() - timestart
+        if not self._print_before_call:
+            PrintColorString("%s (%ds)" % (self._function_description,
+                                           result_time),
+                             TextColors.OKGREEN)
+        if self._print_status:
+            evaluated_result = self._result_evaluator(result)
+            if evaluated_result.is_result_ok:
+                PrintColorString("OK! (%ds)" % (result_time),
+                                 TextColors.OKGREEN)
+            else:
+                PrintColorString("Fail! (%ds)" % (result_time),
+                                 TextColors.FAIL)
+                PrintColorString("Error: %s" %
+                                 evaluated_result.result_message,
+                                 TextColors.FAIL)
+
+    def _PrintFail(self, timestart):
+        """Print the fail status if needed.
+
+        Args:
+            timestart: Float, the start time.
+        """
+        if self._print_status:
+            PrintColorString("Fail! (%ds)" % (time.time() - timestart),
+                             TextColors.FAIL)
+
+    def __enter__(self):
+        """Start counting the execute time of the with-block.
+
+        Raises:
+            ValueError: A result_evaluator is given, the with-block has no
+                        result to evaluate.
+        """
+        if self._result_evaluator is not DefaultEvaluator:
+            raise ValueError("TimeExecute doesn't support result_evaluator "
+                             "as a context manager.")
+        self._timestart = self._Start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Print the execute time of the with-block.
+
+        The with-block has no result to evaluate, so it's ok unless an
+        exception is raised.
+
+        Args:
+            exc_type: Exception type raised within the context manager.
+                      None if no execption is raised.
+            exc_value: Exception instance raised within the context manager.
+                       None if no execption is raised.
+            traceback: Traceback for exeception that is raised within
+                       the context manager.
+                       None if no execption is raised.
+        """
+        if exc_type:
+            self._PrintFail(self._timestart)
+        else:
+            self._PrintResult(self._timestart, None)
 
     def __call__(self, func):
         def DecoratorFunction(*args, **kargs):
@@ -720,34 +819,13 @@ class TimeExecute(object):
             Raises:
                 Exception: The exception that functor(*args, **kwargs) throws.
             """
-            timestart = time.time()
-            if self._print_before_call:
-                waiting_dots = "..." if self._display_waiting_dots else ""
-                PrintColorString("%s %s"% (self._function_description,
-                                           waiting_dots), end="")
+            timestart = self._Start()
             try:
                 result = func(*args, **kargs)
-                result_time = time.time() - timestart
-                if not self._print_before_call:
-                    PrintColorString("%s (%ds)" % (self._function_description,
-                                                   result_time),
-                                     TextColors.OKGREEN)
-                if self._print_status:
-                    evaluated_result = self._result_evaluator(result)
-                    if evaluated_result.is_result_ok:
-                        PrintColorString("OK! (%ds)" % (result_time),
-                                         TextColors.OKGREEN)
-                    else:
-                        PrintColorString("Fail! (%ds)" % (result_time),
-                                         TextColors.FAIL)
-                        PrintColorString("Error: %s" %
-                                         evaluated_result.result_message,
-                                         TextColors.FAIL)
+                self._PrintResult(timestart, result)
                 return result
             except:
-                if self._print_status:
-                    PrintColorString("Fail! (%ds)" % (time.time() - timestart),
-                                     TextColors.FAIL)
+                self._PrintFail(timestart)
                 raise
         return DecoratorFunction
 
@@ -1049,26 +1127,98 @@ def CalculateVNCScreenRatio(avd_width, avd_height):
     return scale_h if scale_h < scale_w else scale_w
 
 
-def IsCommandRunning(command):
+def _ScanProcesses():
+    """Scan the running processes.
+
+    Read /proc/[pid]/cmdline directly so we don't need to fork ps, fall back
+    to ps on the platforms without procfs. Either way the output is decoded
+    once, so the args are always unicode strings.
+
+    Returns:
+        List of ProcessInfo.
+    """
+    cmdline_paths = glob.glob(_PROC_CMDLINE_GLOB)
+    if not cmdline_paths:
+        processes = []
+        ps_output = subprocess.check_output(_CMD_PS_PID_ARGS).decode(
+            "utf-8", "replace")
+        for line in ps_output.splitlines():
+            fields = line.split()
+            if len(fields) > 1:
+                processes.append(ProcessInfo(int(fields[0]), fields[1:]))
+        return processes
+
+    processes = []
+    for cmdline_path in cmdline_paths:
+        try:
+            with open(cmdline_path, "rb") as cmdline_file:
+                cmdline = cmdline_file.read()
+        except (IOError, OSError):
+            # The process has exited after we listed /proc.
+            continue
+        # Kernel threads have an empty cmdline.
+        if not cmdline:
+            continue
+        argv = cmdline.decode("utf-8", "replace").rstrip("\0").split("\0")
+        pid = int(os.path.basename(os.path.dirname(cmdline_path)))
+        processes.append(ProcessInfo(pid, argv))
+    return processes
+
+
+def _InvalidateProcessSnapshot():
+    """Drop the cached snapshot after acloud kills processes."""
+    _process_snapshot_cache["bucket"] = None
+
+
+def GetProcessSnapshot(use_cache=True):
+    """Get the snapshot of the running processes.
+
+    The snapshot is cached for _PROCESS_SNAPSHOT_TTL_SECS, so the callers
+    querying the processes during one acloud command share one scan.
+
+    Args:
+        use_cache: Boolean, False to scan the processes again even if the
+                   cached snapshot hasn't expired, e.g. right before acting
+                   on the result.
+
+    Returns:
+        List of ProcessInfo.
+    """
+    bucket = int(time.time() // _PROCESS_SNAPSHOT_TTL_SECS)
+    if not use_cache or _process_snapshot_cache["bucket"] != bucket:
+        _process_snapshot_cache["snapshot"] = _ScanProcesses()
+        _process_snapshot_cache["bucket"] = bucket
+    return _process_snapshot_cache["snapshot"]
+
+
+def IsCommandRunning(command, use_cache=True):
     """Check if command is running.
 
+    Like "pgrep -f", the command is a pattern searched in the full command
+    line of the processes other than acloud itself. The processes come from
+    GetProcessSnapshot, so the checks within one acloud command share one
+    scan instead of forking pgrep each time.
+
     Args:
         command: String of command name.
+        use_cache: Boolean, False to check against a new process scan.
 
     Returns:
         Boolean, True if command is running. False otherwise.
     """
     try:
-        with open(os.devnull, "w") as dev_null:
-            subprocess.check_call([constants.CMD_PGREP, "-af", command],
-                                  stderr=dev_null, stdout=dev_null)
-        return True
-    except subprocess.CalledProcessError:
+        pattern = re.compile(command)
+    except re.error:
+        logger.debug("Invalid command pattern: %s", command)
         return False
+    current_pid = os.getpid()
+    return any(pattern.search(" ".join(process.argv))
+               for process in GetProcessSnapshot(use_cache=use_cache)
+               if process.pid != current_pid)
 
 
-def AddUserGroupsToCmd(cmd, user_groups):
-    """Add the user groups to the command if necessary.
+def AddUserGroupsToCmdArgs(cmd_args, user_groups):
+    """Add the user groups to the command args if necessary.
 
     As part of local host setup to enable local instance support, the user is
     added to certain groups. For those settings to take effect systemwide
@@ -1077,8 +1227,11 @@ def AddUserGroupsToCmd(cmd, user_groups):
     launch a local instance so add the user to the groups as part of the
     command to ensure success.
 
-    The reason using here-doc instead of '&' is all operations need to be ran in
-    ths same pid.  Here's an example cmd:
+    When the user is already in the groups, the args are returned as they are
+    so the command can be executed without a shell. Otherwise the command is
+    run with a sg here-doc wrapped in "/bin/sh -c". The reason using here-doc
+    instead of '&' is all operations need to be ran in ths same pid.  Here's
+    an example cmd:
     $ sg kvm  << EOF
     sg libvirt
     sg cvdnetwork
@@ -1086,26 +1239,25 @@ def AddUserGroupsToCmd(cmd, user_groups):
     EOF
 
     Args:
-        cmd: String of the command to prepend the user groups to.
+        cmd_args: List of strings, the command and its args.
         user_groups: List of user groups name.(String)
 
     Returns:
-        String of the command with the user groups prepended to it if necessary,
-        otherwise the same existing command.
+        List of strings of the command args to execute.
     """
+    if CheckUserInGroups(user_groups):
+        return list(cmd_args)
+    logger.debug("Need to add user groups to the command")
     user_group_cmd = ""
-    if not CheckUserInGroups(user_groups):
-        logger.debug("Need to add user groups to the command")
-        for idx, group in enumerate(user_groups):
-            user_group_cmd += _CMD_SG + group
-            if idx == 0:
-                user_group_cmd += " <<EOF\n"
-            else:
-                user_group_cmd += "\n"
-        cmd += "\nEOF"
-    user_group_cmd += cmd
+    for idx, group in enumerate(user_groups):
+        user_group_cmd += _CMD_SG + group
+        if idx == 0:
+            user_group_cmd += " <<EOF\n"
+        else:
+            user_group_cmd += "\n"
+    user_group_cmd += " ".join(shlex_quote(arg) for arg in cmd_args) + "\nEOF"
     logger.debug("user group cmd: %s", user_group_cmd)
-    return user_group_cmd
+    return _CMD_SHELL + [user_group_cmd]
 
 
 def CheckUserInGroups(group_name_list):
@@ -1179,6 +1331,7 @@ def CleanupProcess(pattern):
     if IsCommandRunning(pattern):
         command_kill = _CMD_KILL + [pattern]
         subprocess.check_call(command_kill)
+        _InvalidateProcessSnapshot()
 
 
 def TimeoutException(timeout_secs, timeout_error=_DEFAULT_TIMEOUT_ERR):
@@ -324,21 +324,45 @@ class UtilsTest(driver_test_lib.BaseDriverTest):
                 ["fake_gr_1", "fake_gr_4"]))
 
     @mock.patch.object(utils, "CheckUserInGroups")
-    def testAddUserGroupsToCmd(self, mock_user_group):
-        """Test AddUserGroupsToCmd."""
-        command = "test_command"
+    def testAddUserGroupsToCmdArgs(self, mock_user_group):
+        """Test AddUserGroupsToCmdArgs."""
+        cmd_args = ["test_command", "--path", "/with space"]
         groups = ["group1", "group2"]
-        # Don't add user group in command
+        # Don't add user group, the args can be executed without a shell.
         mock_user_group.return_value = True
-        expected_value = "test_command"
-        self.assertEqual(expected_value, utils.AddUserGroupsToCmd(command,
-                                                                  groups))
+        self.assertEqual(cmd_args,
+                         utils.AddUserGroupsToCmdArgs(cmd_args, groups))
 
-        # Add user group in command
+        # Add user group in command which needs to be run by a shell.
         mock_user_group.return_value = False
-        expected_value = "sg group1 <<EOF\nsg group2\ntest_command\nEOF"
-        self.assertEqual(expected_value, utils.AddUserGroupsToCmd(command,
-                                                                  groups))
+        expected_value = ["/bin/sh", "-c",
+                          "sg group1 <<EOF\nsg group2\n"
+                          "test_command --path '/with space'\nEOF"]
+        mock_user_group.reset_mock()
+        self.assertEqual(expected_value,
+                         utils.AddUserGroupsToCmdArgs(cmd_args, groups))
+        # The groups are only checked once.
+        mock_user_group.assert_called_once_with(groups)
+
+    def testTimeExecuteContextManager(self):
+        """Test TimeExecute used as a context manager."""
+        self.Patch(utils, "PrintColorString")
+        with utils.TimeExecute(function_description="fake_description"):
+            pass
+        utils.PrintColorString.assert_called_with(
+            "OK! (0s)", utils.TextColors.OKGREEN)
+
+        with self.assertRaises(ValueError):
+            with utils.TimeExecute(function_description="fake_description"):
+                raise ValueError()
+        utils.PrintColorString.assert_called_with(
+            "Fail! (0s)", utils.TextColors.FAIL)
+
+        # The with-block has no result for the result evaluator.
+        with self.assertRaises(ValueError):
+            with utils.TimeExecute(function_description="fake_description",
+                                   result_evaluator=utils.BootEvaluator):
+                pass
 
     # pylint: disable=invalid-name
     def testTimeoutException(self):
@@ -427,6 +451,70 @@ class UtilsTest(driver_test_lib.BaseDriverTest):
         utils.CleanupSSVncviewer(fake_vnc_port)
         subprocess.check_call.assert_not_called()
 
+    # pylint: disable=protected-access
+    @mock.patch("acloud.internal.lib.utils.open", create=True)
+    @mock.patch("acloud.internal.lib.utils.glob.glob")
+    def testScanProcesses(self, mock_glob, mock_open):
+        """Test _ScanProcesses reads the cmdline of processes from /proc."""
+        mock_glob.return_value = ["/proc/1/cmdline", "/proc/2/cmdline",
+                                  "/proc/3/cmdline"]
+        cmdlines = {"/proc/1/cmdline": b"/sbin/init\x00splash\x00",
+                    "/proc/2/cmdline": b"",
+                    "/proc/3/cmdline": b"ssh\x00-L\x00123:127.0.0.1:6444\x00"}
+        mock_open.side_effect = lambda path, _: mock.mock_open(
+            read_data=cmdlines[path])()
+        self.assertEqual(
+            [utils.ProcessInfo(1, ["/sbin/init", "splash"]),
+             utils.ProcessInfo(3, ["ssh", "-L", "123:127.0.0.1:6444"])],
+            utils._ScanProcesses())
+
+        # Fall back to ps if there is no procfs.
+        mock_glob.return_value = []
+        self.Patch(subprocess, "check_output",
+                   return_value=b"  1 /sbin/init splash\n 3 ssh -L 12:127.0.0.1:64\n")
+        processes = utils._ScanProcesses()
+        self.assertEqual(
+            [utils.ProcessInfo(1, ["/sbin/init", "splash"]),
+             utils.ProcessInfo(3, ["ssh", "-L", "12:127.0.0.1:64"])],
+            processes)
+        self.assertIsInstance(processes[0].argv[0], six.text_type)
+
+    def testIsCommandRunning(self):
+        """Test IsCommandRunning searches the command lines of processes."""
+        self.Patch(utils, "GetProcessSnapshot", return_value=[
+            utils.ProcessInfo(1, ["/sbin/init", "splash"]),
+            utils.ProcessInfo(2, ["ssvnc", "vnc://127.0.0.1:6444"])])
+        self.assertTrue(utils.IsCommandRunning("ssvnc vnc://127.0.0.1:6444"))
+        self.assertTrue(utils.IsCommandRunning("vnc://127.0.0.1:6444"))
+        self.assertFalse(utils.IsCommandRunning("vnc://127.0.0.1:6445"))
+        # An invalid pattern is not running either.
+        self.assertFalse(utils.IsCommandRunning("vnc://[6444"))
+
+        # Skip acloud itself like pgrep does.
+        self.Patch(os, "getpid", return_value=2)
+        self.assertFalse(utils.IsCommandRunning("vnc://127.0.0.1:6444"))
+
+    # pylint: disable=protected-access
+    def testGetProcessSnapshot(self):
+        """Test GetProcessSnapshot reuses the snapshot within the ttl."""
+        self.Patch(utils, "_process_snapshot_cache",
+                   {"bucket": None, "snapshot": None})
+        self.Patch(utils, "_ScanProcesses",
+                   side_effect=[["snapshot_1"], ["snapshot_2"]])
+        self.Patch(time, "time", return_value=100)
+        self.assertEqual(["snapshot_1"], utils.GetProcessSnapshot())
+        self.assertEqual(["snapshot_1"], utils.GetProcessSnapshot())
+        time.time.return_value = 100 + utils._PROCESS_SNAPSHOT_TTL_SECS
+        self.assertEqual(["snapshot_2"], utils.GetProcessSnapshot())
+
+        # A new scan is made if the cache is skipped or invalidated.
+        utils._ScanProcesses.side_effect = [["snapshot_3"], ["snapshot_4"]]
+        self.assertEqual(["snapshot_3"],
+                         utils.GetProcessSnapshot(use_cache=False))
+        self.assertEqual(["snapshot_3"], utils.GetProcessSnapshot())
+        utils._InvalidateProcessSnapshot()
+        self.assertEqual(["snapshot_4"], utils.GetProcessSnapshot())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -50,15 +50,13 @@ _ACLOUD_CVD_TEMP = os.path.join(tempfile.gettempdir(), "acloud_cvd_temp")
 _CVD_RUNTIME_FOLDER_NAME = "cuttlefish_runtime"
 _CVD_STATUS_BIN = "cvd_status"
 _MSG_UNABLE_TO_CALCULATE = "Unable to calculate"
-_RE_GROUP_ADB = "local_adb_port"
-_RE_GROUP_VNC = "local_vnc_port"
-_RE_SSH_TUNNEL_PATTERN = (r"((.*\s*-L\s)(?P<%s>\d+):127.0.0.1:%s)"
-                          r"((.*\s*-L\s)(?P<%s>\d+):127.0.0.1:%s)"
-                          r"(.+%s)")
+_SSH_FORWARD_OPTION = "-L"
+_SSH_FORWARD_HOST = "127.0.0.1"
+# The ssh options that take a value, e.g. "-l user".
+_SSH_OPTIONS_WITH_VALUE = "BbcDEeFIiJLlmOopQRSWw"
+_ssh_tunnels_cache = {"snapshot": None, "ssh_tunnels": None}
 _RE_TIMEZONE = re.compile(r"^(?P<time>[0-9\-\.:T]*)(?P<timezone>[+-]\d+:\d+)$")
 
-_COMMAND_PS_LAUNCH_CVD = ["ps", "-wweo", "lstart,cmd"]
-_RE_RUN_CVD = re.compile(r"(?P<date_str>^[^/]+)(.*run_cvd)")
 _DISPLAY_STRING = "%(x_res)sx%(y_res)s (%(dpi)s)"
 _RE_ZONE = re.compile(r".+/zones/(?P<zone>.+)$")
 _LOCAL_ZONE = "local"
@@ -157,6 +155,85 @@ def GetLocalInstanceRuntimeDir(local_instance_id):
                         _CVD_RUNTIME_FOLDER_NAME)
 
 
+def _ParseSshForwardings(ssh_args):
+    """Parse the local port forwardings of a ssh command.
+
+    The forwardings are in the form of "-L [local port]:127.0.0.1:[target
+    port]", e.g. "-L 12345:127.0.0.1:6444".
+
+    Args:
+        ssh_args: List of strings, the args of the ssh command.
+
+    Returns:
+        Dict mapping the target port to the local port, both are integers.
+    """
+    forwardings = {}
+    for option, value in zip(ssh_args, ssh_args[1:]):
+        if option != _SSH_FORWARD_OPTION:
+            continue
+        fields = value.split(":")
+        if (len(fields) != 3 or fields[1] != _SSH_FORWARD_HOST
+                or not fields[0].isdigit() or not fields[2].isdigit()):
+            continue
+        forwardings[int(fields[2])] = int(fields[0])
+    return forwardings
+
+
+def _GetSshDestination(ssh_args):
+    """Get the destination host of a ssh command.
+
+    The destination is the first arg which isn't an option or the value of an
+    option, e.g. "1.1.1.1" of "ssh -i key -L 1:127.0.0.1:2 -N -l user 1.1.1.1".
+
+    Args:
+        ssh_args: List of strings, the args of the ssh command.
+
+    Returns:
+        String of the destination host, None if it isn't found.
+    """
+    args = iter(ssh_args[1:])
+    for arg in args:
+        if arg == "--":
+            arg = next(args, None)
+        elif arg.startswith("-"):
+            # Options can be grouped like "-Nf", and the value of the last
+            # option of the group is the next arg if it isn't attached.
+            for index, option in enumerate(arg[1:], 2):
+                if option in _SSH_OPTIONS_WITH_VALUE:
+                    if index == len(arg):
+                        next(args, None)
+                    break
+            continue
+        return arg.rsplit("@", 1)[-1] if arg else None
+    return None
+
+
+def _GetSshTunnels():
+    """Get the port forwardings of the running ssh tunnels.
+
+    The ssh processes of the process snapshot are parsed once, so looking up
+    the tunnel of each listed instance doesn't scan all the processes again.
+
+    Returns:
+        Dict mapping the ip of each ssh tunnel destination to a list of dicts,
+        each dict maps the target port to the local port of one ssh tunnel.
+    """
+    snapshot = utils.GetProcessSnapshot()
+    if _ssh_tunnels_cache["snapshot"] is not snapshot:
+        ssh_tunnels = {}
+        for process in snapshot:
+            if (os.path.basename(process.argv[0]) != constants.SSH_BIN
+                    or _SSH_FORWARD_OPTION not in process.argv):
+                continue
+            forwardings = _ParseSshForwardings(process.argv)
+            destination = _GetSshDestination(process.argv)
+            if forwardings and destination:
+                ssh_tunnels.setdefault(destination, []).append(forwardings)
+        _ssh_tunnels_cache["snapshot"] = snapshot
+        _ssh_tunnels_cache["ssh_tunnels"] = ssh_tunnels
+    return _ssh_tunnels_cache["ssh_tunnels"]
+
+
 def _GetCurrentLocalTime():
     """Return a datetime object for current time in local time zone."""
     return datetime.datetime.now(dateutil.tz.tzlocal())
@@ -189,6 +266,13 @@ def _GetElapsedTime(start_time):
 class Instance(object):
     """Class to store data of instance."""
 
+    # List can hold many instances, use __slots__ to skip the per-instance
+    # attribute dict.
+    __slots__ = ("_name", "_fullname", "_status", "_display", "_ip",
+                 "_adb_port", "_vnc_port", "_ssh_tunnel_is_connected",
+                 "_createtime", "_elapsed_time", "_avd_type", "_avd_flavor",
+                 "_is_local", "_device_information", "_zone")
+
     # pylint: disable=too-many-locals
     def __init__(self, name, fullname, display, ip, status=None, adb_port=None,
                  vnc_port=None, ssh_tunnel_is_connected=None, createtime=None,
@@ -312,6 +396,10 @@ class Instance(object):
 
 class LocalInstance(Instance):
     """Class to store data of local cuttlefish instance."""
+
+    __slots__ = ("_cf_runtime_cfg", "_instance_dir", "_virtual_disk_paths",
+                 "_local_instance_id")
+
     def __init__(self, cf_config_path):
         """Initialize a localInstance object.
 
@@ -408,9 +496,9 @@ class LocalInstance(Instance):
                 logger.error("instance_dir is null!! instance[%d] might not be"
                              " deleted", self._local_instance_id)
             subprocess.check_call(
-                utils.AddUserGroupsToCmd(stop_cvd_cmd,
-                                         constants.LIST_CF_USER_GROUPS),
-                stderr=dev_null, stdout=dev_null, shell=True, env=cvd_env)
+                utils.AddUserGroupsToCmdArgs([stop_cvd_cmd],
+                                             constants.LIST_CF_USER_GROUPS),
+                stderr=dev_null, stdout=dev_null, env=cvd_env)
 
         adb_cmd = AdbTools(self.adb_port)
         # When relaunch a local instance, we need to pass in retry=True to make
@@ -441,6 +529,8 @@ class LocalInstance(Instance):
 class LocalGoldfishInstance(Instance):
     """Class to store data of local goldfish instance."""
 
+    __slots__ = ("_id",)
+
     _INSTANCE_NAME_PATTERN = re.compile(
         r"^local-goldfish-instance-(?P<id>\d+)$")
     _CREATION_TIMESTAMP_FILE_NAME = "creation_timestamp.txt"
@@ -562,6 +652,8 @@ class LocalGoldfishInstance(Instance):
 class RemoteInstance(Instance):
     """Class to store data of remote instance."""
 
+    __slots__ = ()
+
     # pylint: disable=too-many-locals
     def __init__(self, gce_instance):
         """Process the args into class vars.
@@ -687,17 +779,13 @@ class RemoteInstance(Instance):
 
         default_vnc_port = utils.AVD_PORT_DICT[avd_type].vnc_port
         default_adb_port = utils.AVD_PORT_DICT[avd_type].adb_port
-        re_pattern = re.compile(_RE_SSH_TUNNEL_PATTERN %
-                                (_RE_GROUP_VNC, default_vnc_port,
-                                 _RE_GROUP_ADB, default_adb_port, ip))
         adb_port = None
         vnc_port = None
-        process_output = subprocess.check_output(constants.COMMAND_PS)
-        for line in process_output.splitlines():
-            match = re_pattern.match(line)
-            if match:
-                adb_port = int(match.group(_RE_GROUP_ADB))
-                vnc_port = int(match.group(_RE_GROUP_VNC))
+        for forwardings in _GetSshTunnels().get(ip, []):
+            if (default_vnc_port in forwardings and
+                    default_adb_port in forwardings):
+                adb_port = forwardings[default_adb_port]
+                vnc_port = forwardings[default_vnc_port]
                 break
 
         logger.debug(("grathering detail for ssh tunnel. "
@@ -17,7 +17,6 @@
 
 import collections
 import datetime
-import subprocess
 
 import unittest
 import mock
@@ -29,6 +28,7 @@ import dateutil.tz
 from acloud.internal import constants
 from acloud.internal.lib import cvd_runtime_config
 from acloud.internal.lib import driver_test_lib
+from acloud.internal.lib import utils
 from acloud.internal.lib.adb_tools import AdbTools
 from acloud.list import instance
 
@@ -41,7 +41,6 @@ class InstanceTest(driver_test_lib.BaseDriverTest):
                      "-o UserKnownHostsFile=/dev/null "
                      "-o StrictHostKeyChecking=no -L 12345:127.0.0.1:6444 "
                      "-L 54321:127.0.0.1:6520 -N -f -l user 1.1.1.1")
-    PS_LAUNCH_CVD = ("Sat Nov 10 21:55:10 2018 /fake_path/bin/run_cvd ")
     PS_RUNTIME_CF_CONFIG = {"x_res": "1080", "y_res": "1920", "dpi": "480"}
     GCE_INSTANCE = {
         constants.INS_KEY_NAME: "fake_ins_name",
@@ -61,7 +60,6 @@ class InstanceTest(driver_test_lib.BaseDriverTest):
     # pylint: disable=protected-access
     def testCreateLocalInstance(self):
         """"Test get local instance info from launch_cvd process."""
-        self.Patch(subprocess, "check_output", return_value=self.PS_LAUNCH_CVD)
         cf_config = mock.MagicMock(
             instance_id=2,
             x_res=1080,
@@ -184,7 +182,9 @@ class InstanceTest(driver_test_lib.BaseDriverTest):
     # pylint: disable=protected-access
     def testGetAdbVncPortFromSSHTunnel(self):
         """"Test Get forwarding adb and vnc port from ssh tunnel."""
-        self.Patch(subprocess, "check_output", return_value=self.PS_SSH_TUNNEL)
+        self.Patch(utils, "GetProcessSnapshot", return_value=[
+            utils.ProcessInfo(1, line.split())
+            for line in self.PS_SSH_TUNNEL.splitlines()])
         self.Patch(instance, "_GetElapsedTime", return_value="fake_time")
         self.Patch(instance.RemoteInstance, "_GetZoneName", return_value="fake_zone")
         forwarded_ports = instance.RemoteInstance(
@@ -193,6 +193,13 @@ class InstanceTest(driver_test_lib.BaseDriverTest):
         self.assertEqual(54321, forwarded_ports.adb_port)
         self.assertEqual(12345, forwarded_ports.vnc_port)
 
+        # If there's no ssh tunnel to the ip.
+        forwarded_ports = instance.RemoteInstance(
+            mock.MagicMock()).GetAdbVncPortFromSSHTunnel(
+                "2.2.2.2", constants.TYPE_CF)
+        self.assertEqual(None, forwarded_ports.adb_port)
+        self.assertEqual(None, forwarded_ports.vnc_port)
+
         # If avd_type is undefined in utils.AVD_PORT_DICT.
         forwarded_ports = instance.RemoteInstance(
             mock.MagicMock()).GetAdbVncPortFromSSHTunnel(
@@ -200,6 +207,52 @@ class InstanceTest(driver_test_lib.BaseDriverTest):
         self.assertEqual(None, forwarded_ports.adb_port)
         self.assertEqual(None, forwarded_ports.vnc_port)
 
+    # pylint: disable=protected-access
+    def testParseSshForwardings(self):
+        """Test _ParseSshForwardings."""
+        ssh_args = ["ssh", "-i", "~/.ssh/acloud_rsa",
+                    "-L", "12345:127.0.0.1:6444", "-L", "54321:127.0.0.1:6520",
+                    "-L", "1111:10.0.0.1:22", "-L", "fake:127.0.0.1:5555",
+                    "-N", "-f", "-l", "user", "1.1.1.1", "-L"]
+        self.assertEqual({6444: 12345, 6520: 54321},
+                         instance._ParseSshForwardings(ssh_args))
+        self.assertEqual({}, instance._ParseSshForwardings(["ssh", "1.1.1.1"]))
+
+    # pylint: disable=protected-access
+    def testGetSshDestination(self):
+        """Test _GetSshDestination skips the options and their values."""
+        ssh_args = ["ssh", "-i", "~/.ssh/acloud_rsa",
+                    "-o", "UserKnownHostsFile=/dev/null",
+                    "-L", "12345:127.0.0.1:6444", "-N", "-f",
+                    "-l", "user", "1.1.1.1", "-o", "ServerAliveInterval=10"]
+        self.assertEqual("1.1.1.1", instance._GetSshDestination(ssh_args))
+        self.assertEqual("1.1.1.1", instance._GetSshDestination(
+            ["ssh", "-Nfl", "user", "-L1:127.0.0.1:2", "user@1.1.1.1"]))
+        self.assertEqual("1.1.1.1", instance._GetSshDestination(
+            ["ssh", "-N", "--", "1.1.1.1"]))
+        self.assertEqual(None, instance._GetSshDestination(
+            ["ssh", "-N", "-l", "user"]))
+
+    # pylint: disable=protected-access
+    def testGetSshTunnels(self):
+        """Test _GetSshTunnels parses the ssh tunnels of the snapshot once."""
+        snapshot = [
+            utils.ProcessInfo(1, ["/fake_ps_1", "-L", "1:127.0.0.1:2"]),
+            utils.ProcessInfo(2, ["ssh", "-L", "12345:127.0.0.1:6444",
+                                  "-L", "54321:127.0.0.1:6520", "-N", "-f",
+                                  "-l", "user", "1.1.1.1"]),
+            utils.ProcessInfo(3, ["/usr/bin/ssh", "-L", "11111:127.0.0.1:5901",
+                                  "-l", "user", "2.2.2.2"])]
+        self.Patch(utils, "GetProcessSnapshot", return_value=snapshot)
+        ssh_tunnels = instance._GetSshTunnels()
+        self.assertEqual([{6444: 12345, 6520: 54321}], ssh_tunnels["1.1.1.1"])
+        self.assertEqual([{5901: 11111}], ssh_tunnels["2.2.2.2"])
+        self.assertNotIn("/fake_ps_1", ssh_tunnels)
+        # The options and their values aren't keys.
+        self.assertEqual(set(["1.1.1.1", "2.2.2.2"]), set(ssh_tunnels))
+        # The same snapshot won't be parsed again.
+        self.assertIs(ssh_tunnels, instance._GetSshTunnels())
+
     # pylint: disable=protected-access
     def testProcessGceInstance(self):
         """"Test process instance detail."""
@@ -33,8 +33,6 @@ from acloud.public import config
 
 logger = logging.getLogger(__name__)
 
-_COMMAND_PS_LAUNCH_CVD = ["ps", "-wweo", "lstart,cmd"]
-
 
 def _ProcessInstances(instance_list):
     """Get more details of remote instances.
@@ -296,14 +296,12 @@ def AddDeletionResultToReport(report_obj, deleted, failed, error_msgs,
         error_msgs: A list of error message strings to be added to the report.
         resource_name: A string, representing the name of the resource.
     """
-    for name in deleted:
-        report_obj.AddData(key="deleted",
-                           value={"name": name,
-                                  "type": resource_name})
-    for name in failed:
-        report_obj.AddData(key="failed",
-                           value={"name": name,
-                                  "type": resource_name})
+    report_obj.ExtendData(key="deleted",
+                          values=[{"name": name, "type": resource_name}
+                                  for name in deleted])
+    report_obj.ExtendData(key="failed",
+                          values=[{"name": name, "type": resource_name}
+                                  for name in failed])
     report_obj.AddErrors(error_msgs)
     if failed or error_msgs:
         report_obj.SetStatus(report.Status.FAIL)
@@ -120,6 +120,17 @@ class Report(object):
         """
         self.data.setdefault(key, []).append(value)
 
+    def ExtendData(self, key, values):
+        """Add a list of values of the same key to the report.
+
+        Args:
+            key: A key of basic type.
+            values: A list of values of any json compatible type. Nothing is
+                    added if it's empty.
+        """
+        if values:
+            self.data.setdefault(key, []).extend(values)
+
     def AddError(self, error):
         """Add error message.
 
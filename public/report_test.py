@@ -37,6 +37,25 @@ class ReportTest(unittest.TestCase):
         }
         self.assertEqual(test_report.data, expected)
 
+    def testExtendData(self):
+        """test ExtendData."""
+        test_report = report.Report("create")
+        test_report.ExtendData("devices", [])
+        self.assertEqual(test_report.data, {})
+        test_report.AddData("devices", {"instance_name": "instance_1"})
+        test_report.ExtendData("devices", [{"instance_name": "instance_2"},
+                                           {"instance_name": "instance_3"}])
+        expected = {
+            "devices": [{
+                "instance_name": "instance_1"
+            }, {
+                "instance_name": "instance_2"
+            }, {
+                "instance_name": "instance_3"
+            }]
+        }
+        self.assertEqual(test_report.data, expected)
+
     def testAddError(self):
         """test AddError."""
         test_report = report.Report("create")